@@ -12,20 +12,37 @@ Data Sources:
 
 import json
 import hashlib
+import logging
 import re
 import os
+from html import unescape
+from io import BytesIO
+from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
-import tempfile
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+import threading
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     import feedparser
     from bs4 import BeautifulSoup
 except ImportError as e:
     print(f"Missing dependency: {e}")
     raise
 
+# Summaries and titles are cleaned here (script/style/applet blocks dropped
+# whole, then tags stripped) and feed links are absolute, so feedparser's
+# HTML sanitizer and relative-URI rewriting would be duplicate passes
+feedparser.SANITIZE_HTML = False
+feedparser.RESOLVE_RELATIVE_URIS = False
+
 # Try to import pandas for ME Excel parsing
 try:
     import pandas as pd
@@ -34,6 +51,40 @@ except ImportError:
     PANDAS_AVAILABLE = False
     print("⚠️ pandas not available - ME Excel parser disabled")
 
+# lxml streams the MassDOT page and reads plain RSS without feedparser;
+# without it both fall back to BeautifulSoup/feedparser
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# requests-cache keeps responses on disk so repeat runs revalidate instead
+# of downloading again; a plain Session is used without it
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# orjson writes the output JSON several times faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyahocorasick matches every keyword in one pass; a regex is the fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Diagnostics that are too noisy for the daily log; NECMIS_VERBOSE=1 shows them
+logger = logging.getLogger('necmis')
+
 
 # =============================================================================
 # CONFIGURATION
@@ -41,6 +92,17 @@ except ImportError:
 
 STATES = ['VT', 'NH', 'ME', 'MA', 'NY', 'RI', 'CT', 'PA']
 
+# Per-feed ETag/Last-Modified validators plus the items they produced
+FEED_CACHE_PATH = 'data/feed_cache.json'
+
+# On-disk HTTP response cache (SQLite, used when requests-cache is installed;
+# CI doesn't install it, so this only applies to local runs)
+HTTP_CACHE_PATH = 'data/http_cache'
+HTTP_CACHE_EXPIRE = 3600
+RSS_CACHE_EXPIRE = 900
+# Bid schedules change at most daily
+DOT_CACHE_EXPIRE = 6 * 3600
+
 RSS_FEEDS = {
     'VTDigger': {'url': 'https://vtdigger.org/feed/', 'state': 'VT'},
     'Union Leader': {'url': 'https://www.unionleader.com/search/?f=rss&t=article&c=news/business&l=25&s=start_time&sd=desc', 'state': 'NH'},
@@ -110,6 +172,35 @@ CONSTRUCTION_KEYWORDS = {
     }
 }
 
+# News items mentioning money are categorized as 'funding' rather than 'news'
+FUNDING_KEYWORDS = ['grant', 'funding', 'award', 'federal', 'million', 'billion', '$']
+
+# Lowercased once here instead of on every keyword test
+_HIGH_LC = [kw.lower() for kw in CONSTRUCTION_KEYWORDS['high_priority']]
+_MED_LC = [kw.lower() for kw in CONSTRUCTION_KEYWORDS['medium_priority']]
+_ALL_LC = _HIGH_LC + _MED_LC
+_BL_LC = {line: [kw.lower() for kw in keywords]
+          for line, keywords in CONSTRUCTION_KEYWORDS['business_line_keywords'].items()}
+
+# Market Health weights (public metrics only, PRD Section 3.3)
+MARKET_HEALTH_WEIGHTS = {
+    'dot_pipeline': 0.15,
+    'housing_permits': 0.10,
+    'construction_spending': 0.10,
+    'migration': 0.10,
+    'input_cost_stability': 0.08,
+    'infrastructure_funding': 0.07
+}
+
+# Baseline readings until the FRED/Census/EIA integrations land
+MARKET_HEALTH_BASELINE = {
+    'housing_permits': {'score': 6.5, 'trend': 'stable', 'action': 'Monitor trends'},
+    'construction_spending': {'score': 6.1, 'trend': 'down', 'action': 'Selective investment'},
+    'migration': {'score': 7.3, 'trend': 'up', 'action': 'Geographic expansion'},
+    'input_cost_stability': {'score': 5.5, 'trend': 'down', 'action': 'Hedge 6 months'},
+    'infrastructure_funding': {'score': 7.8, 'trend': 'stable', 'action': 'Selective growth'}
+}
+
 # ME work type to business line mapping
 ME_WORK_TYPE_MAPPING = {
     'Highway Construction': ['highway', 'hma', 'aggregates'],
@@ -122,33 +213,182 @@ ME_WORK_TYPE_MAPPING = {
 }
 
 
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    # With requests-cache, cache_control=True honors upstream Cache-Control and
+    # revalidates stale entries with ETag/Last-Modified; feeds expire sooner and
+    # the DOT schedules later. stale_if_error serves the last good copy when a
+    # source is down instead of falling back to a portal stub.
+    if REQUESTS_CACHE_AVAILABLE:
+        urls_expire_after = {cfg['url']: RSS_CACHE_EXPIRE for cfg in RSS_FEEDS.values()}
+        urls_expire_after[DOT_SOURCES['MA']['portal_url']] = DOT_CACHE_EXPIRE
+        urls_expire_after[DOT_SOURCES['ME']['excel_url']] = DOT_CACHE_EXPIRE
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_PATH,
+            backend='sqlite',
+            cache_control=True,
+            expire_after=HTTP_CACHE_EXPIRE,
+            urls_expire_after=urls_expire_after,
+            stale_if_error=True
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        # Retry-After on a 429/503 can ask for minutes or hours; ignore it and
+        # keep to the short backoff so one slow source can't stall the run
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                          respect_retry_after_header=False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = 'NECMIS/2.0'
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    The session shared by every DOT and RSS request, so TLS connections are
+    pooled per host. Built on first use: constructing the requests-cache
+    backend creates its sqlite file, which importing the module must not do.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
 # =============================================================================
 # HELPERS
 # =============================================================================
 
+# Patterns compiled once at import rather than looked up per call
+_TAG_RE = re.compile(r'<[^>]+>')
+# Elements whose contents are code, not text (what feedparser's sanitizer drops)
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style|applet)\b.*?</\1\s*>', re.I | re.S)
+_WS_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+')
+_CURRENCY_CHARS_RE = re.compile(r'[,$]')
+
+_log_buffer = threading.local()
+
+
+def log(message: str = '') -> None:
+    """print(), except inside capture_log() where lines are held for the caller."""
+    lines = getattr(_log_buffer, 'lines', None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+@contextmanager
+def capture_log():
+    """Collect this thread's log() lines so concurrent work can be reported in order."""
+    previous = getattr(_log_buffer, 'lines', None)
+    _log_buffer.lines = lines = []
+    try:
+        yield lines
+    finally:
+        _log_buffer.lines = previous
+
+
+def write_json(path: str, data) -> None:
+    with open(path, 'wb') as f:
+        if ORJSON_AVAILABLE:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            f.write(json.dumps(data, indent=2).encode())
+
+
+@lru_cache(maxsize=4096)
 def generate_id(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()[:12]
+    # 6-byte BLAKE2b digest is 12 hex chars natively, no slicing needed
+    return hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=6).hexdigest()
+
+# The three helpers below answer from the same single classify() scan
+# (automaton or compiled alternation regex) instead of one substring test
+# per keyword.
 
 def get_priority(text: str) -> str:
-    text_lower = text.lower()
-    if any(kw.lower() in text_lower for kw in CONSTRUCTION_KEYWORDS['high_priority']):
-        return 'high'
-    if any(kw.lower() in text_lower for kw in CONSTRUCTION_KEYWORDS['medium_priority']):
-        return 'medium'
-    return 'low'
+    return classify(text)[1]
 
 def get_business_lines(text: str) -> List[str]:
-    text_lower = text.lower()
-    lines = []
-    for line, keywords in CONSTRUCTION_KEYWORDS['business_line_keywords'].items():
-        if any(kw.lower() in text_lower for kw in keywords):
-            lines.append(line)
-    return lines if lines else ['highway']
+    return classify(text)[2]
 
 def is_construction_relevant(text: str) -> bool:
-    text_lower = text.lower()
-    all_kw = CONSTRUCTION_KEYWORDS['high_priority'] + CONSTRUCTION_KEYWORDS['medium_priority']
-    return any(kw.lower() in text_lower for kw in all_kw)
+    return classify(text)[0]
+
+
+def _build_keyword_tags() -> Dict[str, frozenset]:
+    """Map each lowercased keyword to the priority/business-line/funding tags it implies."""
+    tags = {}
+    for kw in _HIGH_LC:
+        tags.setdefault(kw, set()).add('high')
+    for kw in _MED_LC:
+        tags.setdefault(kw, set()).add('medium')
+    for line, keywords in _BL_LC.items():
+        for kw in keywords:
+            tags.setdefault(kw, set()).add(f'bl:{line}')
+    for kw in FUNDING_KEYWORDS:
+        tags.setdefault(kw.lower(), set()).add('funding')
+    # A match on 'bridge deck' is also a match on 'bridge' and 'deck'. The
+    # regex fallback reports only the longest keyword at each position, so
+    # fold the tags of contained keywords into the containing one.
+    return {kw: frozenset().union(*(t for other, t in tags.items() if other in kw))
+            for kw in tags}
+
+
+_KEYWORD_TAGS = _build_keyword_tags()
+
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _tags in _KEYWORD_TAGS.items():
+        _KEYWORD_AUTOMATON.add_word(_kw, _tags)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    # Zero-width lookahead so overlapping keywords are still found;
+    # longest-first alternation picks the longest keyword at each position
+    _KEYWORD_RE = re.compile('(?=(' + '|'.join(
+        re.escape(kw) for kw in sorted(_KEYWORD_TAGS, key=len, reverse=True)) + '))')
+
+
+def classify(text: str, text_lower: Optional[str] = None) -> Tuple[bool, str, List[str], str]:
+    """
+    Relevance, priority, business lines and news category from a single
+    keyword scan.
+    Pass text_lower when the caller already has the lowercased text.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    relevant, priority, lines, category = _classify_lower(text_lower)
+    return relevant, priority, list(lines), category
+
+
+# Syndicated headlines repeat across feeds; the cached result is immutable
+# and classify() hands each caller its own business_lines list
+@lru_cache(maxsize=4096)
+def _classify_lower(text_lower: str) -> Tuple[bool, str, Tuple[str, ...], str]:
+    if AHOCORASICK_AVAILABLE:
+        hits = [tags for _, tags in _KEYWORD_AUTOMATON.iter(text_lower)]
+    else:
+        hits = [_KEYWORD_TAGS[m.group(1)] for m in _KEYWORD_RE.finditer(text_lower)]
+    found = frozenset().union(*hits)
+    
+    relevant = 'high' in found or 'medium' in found
+    priority = 'high' if 'high' in found else 'medium' if 'medium' in found else 'low'
+    lines = tuple(line for line in _BL_LC if f'bl:{line}' in found)
+    category = 'funding' if 'funding' in found else 'news'
+    return relevant, priority, lines if lines else ('highway',), category
 
 def format_currency(amount) -> Optional[str]:
     if amount is None:
@@ -166,18 +406,20 @@ def parse_currency(text: str) -> Optional[float]:
         return None
     if isinstance(text, (int, float)):
         return float(text)
-    cleaned = re.sub(r'[,$]', '', str(text).strip())
+    cleaned = _CURRENCY_CHARS_RE.sub('', str(text).strip())
     try:
         return float(cleaned)
     except ValueError:
         return None
 
+# MassDOT repeats the same town names across blocks
+@lru_cache(maxsize=512)
 def clean_location(loc: str) -> str:
     if not loc:
         return None
     loc = str(loc).strip()
     if loc.upper().startswith('DISTRICT'):
-        num = re.search(r'\d+', loc)
+        num = _DIGITS_RE.search(loc)
         return f"District {num.group()}" if num else "Various Locations"
     return loc.title()
 
@@ -186,46 +428,155 @@ def clean_location(loc: str) -> str:
 # MASSDOT PARSER (HTML/Plain Text)
 # =============================================================================
 
+# 64KB chunks keep the download overlapped with parsing without tiny reads
+MASSDOT_CHUNK_SIZE = 64 * 1024
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_TRAILING_COMMA_RE = re.compile(r'\s*,\s*$')
+_DOLLAR_RE = re.compile(r'\$([0-9,]+\.?\d*)')
+
+# Fields within one project block
+_LOC_RE = re.compile(r'Location:\s*([A-Z][A-Za-z0-9\s\-,]+?)(?:\s+Description:|$)')
+_DESC_RE = re.compile(r'Description:\s*(.+?)(?:\s+District:|$)', re.DOTALL)
+_VALUE_RE = re.compile(r'Project Value:\s*\$([0-9,]+\.?\d*)')
+_PROJ_NUM_RE = re.compile(r'Project Number:\s*(\d+)')
+_PROJ_TYPE_RE = re.compile(r'Project Type:\s*([^\n]+)')
+_AD_DATE_RE = re.compile(r'Ad Date:\s*(\d{1,2}/\d{1,2}/\d{4})')
+_DISTRICT_RE = re.compile(r'District:\s*(\d+)')
+
+# Line-by-line fallback variants (the others are shared with the block pass)
+_LINE_LOC_RE = re.compile(r'Location:\s*([A-Z][A-Za-z0-9\s\-,]+)')
+_LINE_DESC_RE = re.compile(r'Description:\s*(.+?)(?=\s*District:|\n)')
+_LINE_DISTRICT_RE = re.compile(r'District:\s*(\d+)\s*Ad Date:')
+
+
+class _PageText:
+    """
+    lxml parser target that collects a page's strings the way BeautifulSoup's
+    get_text() does after <script>/<style> are decomposed: text between two
+    markup events is one string, and all-whitespace strings outside
+    <pre>/<textarea> shrink to a single newline or space. No tree is built.
+    """
+    _SKIP = frozenset(['script', 'style'])
+    _PRESERVE = frozenset(['pre', 'textarea'])
+    _ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+    def __init__(self):
+        self.strings = []
+        self._pending = []
+        self._skip = 0
+        self._preserve = 0
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending = []
+        if not self._preserve and not text.strip(self._ASCII_SPACES):
+            text = '\n' if '\n' in text else ' '
+        self.strings.append(text)
+
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in self._SKIP:
+            self._skip += 1
+        elif tag in self._PRESERVE:
+            self._preserve += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in self._SKIP:
+            self._skip -= 1
+        elif tag in self._PRESERVE:
+            self._preserve -= 1
+
+    def data(self, data):
+        if not self._skip:
+            self._pending.append(data)
+
+    def comment(self, text):
+        self._flush()
+
+    def doctype(self, *args):
+        self._flush()
+
+    def pi(self, *args):
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return '\n'.join(self.strings)
+
+
+def _massdot_text_lxml(response) -> Tuple[str, int]:
+    """
+    Stream the page through an lxml parser target and return (text, bytes
+    read). Chunks are parsed as they download and no tree is kept.
+    """
+    parser = etree.HTMLParser(target=_PageText(), encoding=response.encoding)
+    size = 0
+    for chunk in response.iter_content(chunk_size=MASSDOT_CHUNK_SIZE):
+        size += len(chunk)
+        parser.feed(chunk)
+    if not size:
+        return '', 0
+    return parser.close(), size
+
+
 def parse_massdot() -> List[Dict]:
     """Parse MassDOT by converting HTML to plain text first."""
     url = DOT_SOURCES['MA']['portal_url']
     lettings = []
     
     try:
-        print(f"    🔍 Fetching MassDOT...")
-        response = requests.get(url, timeout=30, headers={
+        log(f"    🔍 Fetching MassDOT...")
+        response = get_session().get(url, timeout=30, stream=True, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         response.raise_for_status()
-        html = response.text
         
-        print(f"    📄 Got {len(html)} bytes")
+        if LXML_AVAILABLE:
+            text, size = _massdot_text_lxml(response)
+        else:
+            # Hand BS4 the raw bytes and the declared charset so it skips sniffing
+            html = response.content
+            size = len(html)
+            soup = BeautifulSoup(html, 'html.parser', from_encoding=response.encoding)
+            # Values often sit in plain text beside a <b> label, so the whole
+            # page is kept; only code is dropped
+            for script in soup(["script", "style"]):
+                script.decompose()
+            text = soup.get_text(separator='\n')
         
-        soup = BeautifulSoup(html, 'html.parser')
-        for script in soup(["script", "style"]):
-            script.decompose()
+        log(f"    📄 Got {size} bytes")
         
-        text = soup.get_text(separator='\n')
-        text = re.sub(r'\n\s*\n', '\n', text)
+        text = _BLANK_LINES_RE.sub('\n', text)
         
-        print(f"    📝 Converted to {len(text)} chars of text")
+        log(f"    📝 Converted to {len(text)} chars of text")
         
-        # Split into project blocks
-        blocks = re.split(r'(?=Location:)', text)
-        print(f"    📦 Found {len(blocks)} potential project blocks")
+        # Split into project blocks at each 'Location:'; only blocks that
+        # contain a value are sliced out of the text
+        starts = [0]
+        pos = text.find('Location:')
+        while pos != -1:
+            starts.append(pos)
+            pos = text.find('Location:', pos + 1)
+        ends = starts[1:] + [len(text)]
+        log(f"    📦 Found {len(starts)} potential project blocks")
         
         projects = []
-        for block in blocks:
-            if 'Project Value:' not in block:
+        for start, end in zip(starts, ends):
+            if text.find('Project Value:', start, end) == -1:
                 continue
+            block = text[start:end]
             
-            loc_match = re.search(r'Location:\s*([A-Z][A-Za-z0-9\s\-,]+?)(?:\s+Description:|$)', block)
-            desc_match = re.search(r'Description:\s*(.+?)(?:\s+District:|$)', block, re.DOTALL)
-            value_match = re.search(r'Project Value:\s*\$([0-9,]+\.?\d*)', block)
-            proj_num_match = re.search(r'Project Number:\s*(\d+)', block)
-            proj_type_match = re.search(r'Project Type:\s*([^\n]+)', block)
-            ad_date_match = re.search(r'Ad Date:\s*(\d{1,2}/\d{1,2}/\d{4})', block)
-            district_match = re.search(r'District:\s*(\d+)', block)
+            loc_match = _LOC_RE.search(block)
+            desc_match = _DESC_RE.search(block)
+            value_match = _VALUE_RE.search(block)
+            proj_num_match = _PROJ_NUM_RE.search(block)
+            proj_type_match = _PROJ_TYPE_RE.search(block)
+            ad_date_match = _AD_DATE_RE.search(block)
+            district_match = _DISTRICT_RE.search(block)
             
             if value_match:
                 projects.append({
@@ -238,20 +589,20 @@ def parse_massdot() -> List[Dict]:
                     'district': district_match.group(1) if district_match else None
                 })
         
-        print(f"    📊 Extracted {len(projects)} projects with values")
+        log(f"    📊 Extracted {len(projects)} projects with values")
         
         # Fallback: line-by-line extraction
         if not projects:
-            print(f"    🔄 Trying line-by-line extraction...")
-            values = re.findall(r'Project Value:\s*\$([0-9,]+\.?\d*)', text)
-            locations = re.findall(r'Location:\s*([A-Z][A-Za-z0-9\s\-,]+)', text)
-            descriptions = re.findall(r'Description:\s*(.+?)(?=\s*District:|\n)', text)
-            proj_nums = re.findall(r'Project Number:\s*(\d+)', text)
-            proj_types = re.findall(r'Project Type:\s*([^\n]+)', text)
-            ad_dates = re.findall(r'Ad Date:\s*(\d{1,2}/\d{1,2}/\d{4})', text)
-            districts = re.findall(r'District:\s*(\d+)\s*Ad Date:', text)
+            log(f"    🔄 Trying line-by-line extraction...")
+            values = _VALUE_RE.findall(text)
+            locations = _LINE_LOC_RE.findall(text)
+            descriptions = _LINE_DESC_RE.findall(text)
+            proj_nums = _PROJ_NUM_RE.findall(text)
+            proj_types = _PROJ_TYPE_RE.findall(text)
+            ad_dates = _AD_DATE_RE.findall(text)
+            districts = _LINE_DISTRICT_RE.findall(text)
             
-            print(f"    Line extraction: {len(values)} val, {len(locations)} loc, {len(descriptions)} desc")
+            log(f"    Line extraction: {len(values)} val, {len(locations)} loc, {len(descriptions)} desc")
             
             for i in range(len(values)):
                 projects.append({
@@ -266,8 +617,8 @@ def parse_massdot() -> List[Dict]:
         
         # Fallback: dollar-only extraction
         if not projects:
-            print(f"    🔄 Falling back to dollar-only extraction...")
-            all_values = re.findall(r'\$([0-9,]+\.?\d*)', text)
+            log(f"    🔄 Falling back to dollar-only extraction...")
+            all_values = _DOLLAR_RE.findall(text)
             for i, v in enumerate(all_values):
                 val = parse_currency(v)
                 if val and 100000 <= val <= 500000000:
@@ -289,11 +640,11 @@ def parse_massdot() -> List[Dict]:
             
             location = clean_location(p['location'])
             desc = p['description'] or f"MassDOT Project - {location or 'Various Locations'}"
-            desc = re.sub(r'\s+', ' ', desc).strip()
+            desc = _WS_RE.sub(' ', desc).strip()
             
             proj_type = p['project_type']
             if proj_type:
-                proj_type = re.sub(r'\s*,\s*$', '', proj_type)[:60]
+                proj_type = _TRAILING_COMMA_RE.sub('', proj_type)[:60]
             
             ad_date = None
             if p['ad_date']:
@@ -329,15 +680,15 @@ def parse_massdot() -> List[Dict]:
         
         if lettings:
             total = sum(l.get('cost_low') or 0 for l in lettings)
-            print(f"    ✓ {len(lettings)} projects, {format_currency(total)} total pipeline")
+            log(f"    ✓ {len(lettings)} projects, {format_currency(total)} total pipeline")
         else:
-            print(f"    ⚠ No projects parsed")
+            log(f"    ⚠ No projects parsed")
             lettings.append(create_portal_stub('MA'))
             
     except Exception as e:
-        print(f"    ✗ Error: {e}")
+        log(f"    ✗ Error: {e}")
         import traceback
-        traceback.print_exc()
+        log(traceback.format_exc().rstrip())
         lettings.append(create_portal_stub('MA'))
     
     return lettings
@@ -363,36 +714,33 @@ def parse_mainedot() -> List[Dict]:
     - Total Project Estimate
     """
     if not PANDAS_AVAILABLE:
-        print(f"    ⚠️ pandas not available, using portal stub")
+        log(f"    ⚠️ pandas not available, using portal stub")
         return [create_portal_stub('ME')]
     
     cfg = DOT_SOURCES['ME']
     lettings = []
     
     try:
-        print(f"    🔍 Fetching MaineDOT Excel...")
+        log(f"    🔍 Fetching MaineDOT Excel...")
         
         # Download Excel file
-        response = requests.get(cfg['excel_url'], timeout=30, headers={
+        response = get_session().get(cfg['excel_url'], timeout=30, headers={
             'User-Agent': 'Mozilla/5.0 (compatible; NECMIS/2.0)'
         })
         response.raise_for_status()
         
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix='.xls', delete=False) as f:
-            f.write(response.content)
-            temp_path = f.name
-        
-        print(f"    📄 Downloaded {len(response.content):,} bytes")
+        log(f"    📄 Downloaded {len(response.content):,} bytes")
         
-        # Read Excel
+        # Read Excel straight from memory
+        buf = BytesIO(response.content)
         try:
-            df = pd.read_excel(temp_path, engine='xlrd')
+            df = pd.read_excel(buf, engine='xlrd')
         except Exception:
-            df = pd.read_excel(temp_path, engine='openpyxl')
+            buf.seek(0)
+            df = pd.read_excel(buf, engine='openpyxl')
         
-        print(f"    📊 Loaded {len(df)} rows")
-        print(f"    Columns: {list(df.columns)[:5]}...")
+        log(f"    📊 Loaded {len(df)} rows")
+        log(f"    Columns: {list(df.columns)[:5]}...")
         
         # Normalize column names
         df.columns = [str(c).strip() for c in df.columns]
@@ -418,106 +766,96 @@ def parse_mainedot() -> List[Dict]:
             elif 'estimate' in col_lower or 'total' in col_lower:
                 col_map['cost'] = col
         
-        # Parse each row
-        for idx, row in df.iterrows():
-            try:
-                work_type = str(row.get(col_map.get('work_type', ''), '')).strip()
-                location = str(row.get(col_map.get('location', ''), '')).strip()
-                project_id = str(row.get(col_map.get('project_id', ''), '')).strip()
-                
-                # Skip empty rows
-                if not location or location.lower() == 'nan' or not location:
-                    continue
-                
-                # Parse cost
-                cost_raw = row.get(col_map.get('cost', ''))
-                cost = None
-                if pd.notna(cost_raw):
-                    cost_str = str(cost_raw).replace('$', '').replace(',', '').strip()
-                    try:
-                        cost = float(cost_str)
-                    except ValueError:
-                        pass
-                
-                # Parse date
-                ad_date_raw = row.get(col_map.get('ad_date', ''))
-                ad_date = None
-                if pd.notna(ad_date_raw):
-                    if isinstance(ad_date_raw, datetime):
-                        ad_date = ad_date_raw.strftime('%Y-%m-%d')
-                    else:
-                        try:
-                            ad_date = pd.to_datetime(ad_date_raw).strftime('%Y-%m-%d')
-                        except:
-                            pass
-                
-                # Build description
-                scope = str(row.get(col_map.get('scope', ''), '')).strip()
-                details = str(row.get(col_map.get('details', ''), '')).strip()
-                
-                description = location
-                if scope and scope.lower() != 'nan':
-                    description = f"{scope}: {location}"
-                if details and details.lower() != 'nan':
-                    description += f" - {details}"
-                
-                # Get business lines from work type
-                business_lines = []
-                for wt, bl in ME_WORK_TYPE_MAPPING.items():
-                    if wt.lower() in work_type.lower():
-                        business_lines.extend(bl)
-                if not business_lines:
-                    business_lines = get_business_lines(description)
-                business_lines = list(set(business_lines))
-                
-                # Clean project_id
-                if project_id.lower() == 'nan':
-                    project_id = None
-                
-                # Determine priority
-                priority = 'high' if cost and cost >= 1000000 else 'medium' if cost and cost >= 100000 else 'low'
-                
-                letting = {
-                    'id': generate_id(f"ME-{project_id or idx}-{location[:25]}"),
-                    'state': 'ME',
-                    'project_id': project_id,
-                    'description': description[:250],
-                    'cost_low': int(cost) if cost else None,
-                    'cost_high': int(cost) if cost else None,
-                    'cost_display': format_currency(cost) if cost else 'See Portal',
-                    'ad_date': ad_date,
-                    'let_date': None,
-                    'project_type': work_type if work_type.lower() != 'nan' else None,
-                    'location': location,
-                    'district': None,
-                    'url': cfg['portal_url'],
-                    'source': 'MaineDOT',
-                    'business_lines': business_lines
-                }
-                lettings.append(letting)
-                
-            except Exception as e:
-                print(f"    ⚠️ Row {idx} error: {e}")
-                continue
+        # Whole-column string/number/date conversions, then one comprehension
+        # to build the letting dicts
+        def text_col(key):
+            if key not in col_map:
+                return pd.Series('', index=df.index)
+            return df[col_map[key]].map(str).str.strip()
         
-        # Cleanup temp file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
+        def valid(col):
+            return col.ne('') & col.str.lower().ne('nan')
+        
+        location = text_col('location')
+        keep = valid(location)
+        df = df[keep]
+        location = location[keep]
+        work_type = text_col('work_type')
+        project_id = text_col('project_id')
+        scope = text_col('scope')
+        details = text_col('details')
+        
+        # Parse cost
+        if 'cost' in col_map:
+            cost_raw = df[col_map['cost']]
+            cost_str = cost_raw.map(str).str.replace('$', '', regex=False).str.replace(',', '', regex=False).str.strip()
+            costs = pd.to_numeric(cost_str.where(cost_raw.notna()), errors='coerce')
+        else:
+            costs = pd.Series(float('nan'), index=df.index)
+        
+        # Parse date
+        if 'ad_date' in col_map:
+            ad_raw = df[col_map['ad_date']]
+            if not pd.api.types.is_datetime64_any_dtype(ad_raw):
+                ad_raw = pd.to_datetime(ad_raw, errors='coerce', format='mixed')
+            ad_dates = ad_raw.dt.strftime('%Y-%m-%d')
+        else:
+            ad_dates = pd.Series(None, index=df.index, dtype=object)
+        
+        # Build description
+        description = location.where(~valid(scope), scope + ': ' + location)
+        description = description.where(~valid(details), description + ' - ' + details)
+        
+        # Business lines per distinct work type
+        work_type_lines = {}
+        for wt_value in work_type.unique():
+            lines = []
+            for wt, bl in ME_WORK_TYPE_MAPPING.items():
+                if wt.lower() in wt_value.lower():
+                    lines.extend(bl)
+            work_type_lines[wt_value] = lines
+        
+        # Missing values become None up front so every row converts cleanly;
+        # non-finite costs are treated as missing
+        cost_ok = costs.notna() & costs.abs().ne(float('inf'))
+        costs = costs.astype(object).where(cost_ok, None)
+        ad_dates = ad_dates.astype(object).where(ad_dates.notna(), None)
+        project_type = work_type.astype(object).where(work_type.str.lower().ne('nan'), None)
+        id_key = project_id.where(valid(project_id), df.index.map(str).to_series(index=df.index))
+        ids = ('ME-' + id_key + '-' + location.str[:25]).map(generate_id)
+        project_id = project_id.astype(object).where(project_id.str.lower().ne('nan'), None)
+        
+        lettings = [{
+            'id': letting_id,
+            'state': 'ME',
+            'project_id': pid,
+            'description': desc[:250],
+            'cost_low': int(cost) if cost else None,
+            'cost_high': int(cost) if cost else None,
+            'cost_display': format_currency(cost) if cost else 'See Portal',
+            'ad_date': ad_date,
+            'let_date': None,
+            'project_type': ptype,
+            'location': loc,
+            'district': None,
+            'url': cfg['portal_url'],
+            'source': 'MaineDOT',
+            'business_lines': list(set(work_type_lines[wt_value] or get_business_lines(desc)))
+        } for letting_id, wt_value, ptype, loc, pid, desc, cost, ad_date in zip(
+            ids, work_type, project_type, location, project_id, description, costs, ad_dates)]
         
         if lettings:
-            with_cost = len([l for l in lettings if l.get('cost_low')])
+            with_cost = sum(1 for l in lettings if l.get('cost_low'))
             total = sum(l.get('cost_low') or 0 for l in lettings)
-            print(f"    ✓ {len(lettings)} projects ({with_cost} with $), {format_currency(total)} total pipeline")
+            log(f"    ✓ {len(lettings)} projects ({with_cost} with $), {format_currency(total)} total pipeline")
         else:
-            print(f"    ⚠ No projects parsed from Excel")
+            log(f"    ⚠ No projects parsed from Excel")
             lettings.append(create_portal_stub('ME'))
             
     except Exception as e:
-        print(f"    ✗ Error: {e}")
+        log(f"    ✗ Error: {e}")
         import traceback
-        traceback.print_exc()
+        log(traceback.format_exc().rstrip())
         lettings.append(create_portal_stub('ME'))
     
     return lettings
@@ -548,107 +886,268 @@ def create_portal_stub(state: str) -> Dict:
     }
 
 
-def fetch_dot_lettings() -> List[Dict]:
-    lettings = []
-    for state, cfg in DOT_SOURCES.items():
-        print(f"  🏗️ {cfg['name']} ({state})...")
+def _fetch_one_dot(item: Tuple[str, Dict]) -> Tuple[List[Dict], List[str]]:
+    """Fetch one state's lettings; its log lines are returned for in-order output."""
+    state, cfg = item
+    with capture_log() as lines:
+        log(f"  🏗️ {cfg['name']} ({state})...")
         try:
-            if cfg['parser'] == 'active':
-                if state == 'MA':
-                    lettings.extend(parse_massdot())
-                elif state == 'ME':
-                    lettings.extend(parse_mainedot())
-                else:
-                    lettings.append(create_portal_stub(state))
-                    print(f"    ✓ Portal link")
+            if cfg['parser'] == 'active' and state == 'MA':
+                lettings = parse_massdot()
+            elif cfg['parser'] == 'active' and state == 'ME':
+                lettings = parse_mainedot()
             else:
-                lettings.append(create_portal_stub(state))
-                print(f"    ✓ Portal link")
+                lettings = [create_portal_stub(state)]
+                log(f"    ✓ Portal link")
         except Exception as e:
-            print(f"    ✗ {e}")
-            lettings.append(create_portal_stub(state))
+            log(f"    ✗ {e}")
+            lettings = [create_portal_stub(state)]
+    return lettings, lines
+
+
+def fetch_dot_lettings() -> List[Dict]:
+    lettings = []
+    # Each portal is an independent blocking GET, so fetch them all at once
+    with ThreadPoolExecutor(max_workers=len(DOT_SOURCES)) as ex:
+        for state_lettings, lines in ex.map(_fetch_one_dot, DOT_SOURCES.items()):
+            for line in lines:
+                log(line)
+            lettings.extend(state_lettings)
     return lettings
 
 
-def fetch_rss_feeds() -> List[Dict]:
+def load_feed_cache() -> Dict:
+    try:
+        with open(FEED_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_feed_cache(cache: Dict) -> None:
+    os.makedirs(os.path.dirname(FEED_CACHE_PATH), exist_ok=True)
+    write_json(FEED_CACHE_PATH, cache)
+
+
+def _fetch_feed(cfg: Dict, cached: Dict) -> requests.Response:
+    """Conditional GET: an unchanged feed comes back as an empty 304."""
+    headers = {}
+    if 'items' in cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('modified'):
+            headers['If-Modified-Since'] = cached['modified']
+    response = get_session().get(cfg['url'], timeout=15, headers=headers)
+    response.raise_for_status()
+    return response
+
+
+def _clean_summary(summary: str) -> str:
+    """Tag-strip for a 300-char preview; no need for a full HTML parser."""
+    if not summary:
+        return ''
+    # Plain-text summaries (the common case) skip the tag regexes entirely
+    if '<' in summary:
+        summary = _TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', summary))
+    return unescape(_WS_RE.sub(' ', summary))[:300].strip()
+
+
+# Every word of every relevance keyword. Cleaning only removes markup (and
+# tags may split a phrase like 'contract award'), so raw text containing none
+# of these words cannot be relevant once cleaned.
+_RELEVANCE_WORDS = tuple(dict.fromkeys(word for kw in _ALL_LC for word in kw.split()))
+
+
+# Plain RSS 2.0 <item> children the fast parser understands. Anything else
+# (content:encoded, dc:date, ...) could change what feedparser reports.
+_RSS_ITEM_FIELDS = frozenset(['title', 'link', 'description', 'pubDate', 'guid',
+                              'category', 'author', 'comments', 'source', 'enclosure'])
+
+
+def _parse_rss_fast(content: bytes, limit: int = 20) -> Optional[List[Dict]]:
+    """
+    Read the first `limit` items of a plain RSS 2.0 feed with lxml, as
+    feedparser-style entry dicts. Returns None for anything it isn't sure it
+    reads the way feedparser would (Atom, RDF, extensions, nested markup,
+    missing links, odd dates, malformed XML) so the caller can fall back.
+    """
+    entries = []
+    try:
+        events = etree.iterparse(BytesIO(content), events=('start', 'end'),
+                                 resolve_entities=False, no_network=True)
+        _, root = next(events)
+        if root.tag != 'rss':
+            return None
+        for event, elem in events:
+            if event != 'end' or elem.tag != 'item':
+                continue
+            fields = {}
+            for child in elem:
+                if child.tag not in _RSS_ITEM_FIELDS or len(child) or child.tag in fields:
+                    return None
+                fields[child.tag] = (child.text or '').strip()
+            if not fields.get('link'):
+                return None
+            pub = None
+            if 'pubDate' in fields:
+                try:
+                    dt = parsedate_to_datetime(fields['pubDate'])
+                except (TypeError, ValueError):
+                    return None
+                # A missing or "-0000" zone parses naive, and feedparser
+                # treats those differently (none vs UTC); leave them to it
+                if dt.tzinfo is None:
+                    return None
+                # feedparser reports dates in UTC
+                pub = dt.astimezone(timezone.utc).timetuple()
+            entries.append({
+                'title': fields.get('title', ''),
+                'summary': fields.get('description', ''),
+                'link': fields['link'],
+                'published_parsed': pub
+            })
+            elem.clear()
+            if len(entries) == limit:
+                break
+    except (etree.XMLSyntaxError, StopIteration):
+        return None
+    return entries
+
+
+def _parse_feed_items(source: str, cfg: Dict, content: bytes, today_str: str) -> List[Dict]:
+    entries = _parse_rss_fast(content) if LXML_AVAILABLE else None
+    if entries is None:
+        feed = feedparser.parse(content)
+        if feed.bozo:
+            # %s formatting is lazy: the exception is only stringified under DEBUG
+            logger.debug("%s: feed parse warning: %s", source, feed.bozo_exception)
+        entries = islice(feed.entries, 20)
+    items = []
+    for entry in entries:
+        # With the sanitizer off, markup in titles must not reach the dashboard
+        title = entry.get('title', '')
+        if '<' in title:
+            # Same as summaries: a tag separates words (Road<br>work)
+            title = _TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', title))
+            title = _WS_RE.sub(' ', title).strip()
+        raw_summary = entry.get('summary', entry.get('description', ''))
+        raw_lower = f"{title} {raw_summary}".lower()
+        if not any(word in raw_lower for word in _RELEVANCE_WORDS):
+            continue
+        
+        summary = _clean_summary(raw_summary)
+        link = entry.get('link', '')
+        
+        combined = f"{title} {summary}"
+        combined_lc = combined.lower()
+        relevant, priority, business_lines, category = classify(combined, combined_lc)
+        if not relevant:
+            continue
+        
+        pub = entry.get('published_parsed') or entry.get('updated_parsed')
+        date_str = f"{pub.tm_year:04d}-{pub.tm_mon:02d}-{pub.tm_mday:02d}" if pub else today_str
+        
+        items.append({
+            'id': generate_id(link or title),
+            'title': title,
+            'summary': summary,
+            'url': link,
+            'source': source,
+            'state': cfg['state'],
+            'date': date_str,
+            'category': category,
+            'priority': priority,
+            'business_lines': business_lines
+        })
+    return items
+
+
+def _collect_feed(source: str, cfg: Dict, cached: Dict,
+                  today_str: str) -> Tuple[requests.Response, Optional[List[Dict]]]:
+    """
+    Worker-thread body: download, then parse and clean summaries while the
+    other feeds are still downloading. Items are None on a 304.
+    """
+    response = _fetch_feed(cfg, cached)
+    if response.status_code == 304:
+        return response, None
+    return response, _parse_feed_items(source, cfg, response.content, today_str)
+
+
+def fetch_rss_feeds(today_str: Optional[str] = None) -> List[Dict]:
     news = []
-    for source, cfg in RSS_FEEDS.items():
-        try:
-            print(f"  📰 {source}...")
-            feed = feedparser.parse(cfg['url'], request_headers={'User-Agent': 'NECMIS/2.0'})
-            count = 0
-            for entry in feed.entries[:20]:
-                title = entry.get('title', '')
-                summary = entry.get('summary', entry.get('description', ''))
-                link = entry.get('link', '')
-                
-                if summary:
-                    summary = BeautifulSoup(summary, 'html.parser').get_text()[:300].strip()
-                
-                combined = f"{title} {summary}"
-                if not is_construction_relevant(combined):
+    cache = load_feed_cache()
+    # Fallback date for undated entries, computed once rather than per entry
+    if today_str is None:
+        today_str = datetime.now().strftime('%Y-%m-%d')
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as ex:
+        jobs = {source: ex.submit(_collect_feed, source, cfg, cache.get(source, {}), today_str)
+                for source, cfg in RSS_FEEDS.items()}
+        # Report in feed order; each result is ready as soon as its worker is
+        for source in RSS_FEEDS:
+            try:
+                log(f"  📰 {source}...")
+                response, items = jobs[source].result()
+                if items is None:
+                    items = cache[source]['items']
+                    news.extend(items)
+                    log(f"    ✓ {len(items)} items (not modified)")
                     continue
                 
-                pub = entry.get('published_parsed') or entry.get('updated_parsed')
-                date_str = datetime(*pub[:6]).strftime('%Y-%m-%d') if pub else datetime.now().strftime('%Y-%m-%d')
-                
-                funding_kw = ['grant', 'funding', 'award', 'federal', 'million', 'billion', '$']
-                category = 'funding' if any(k in combined.lower() for k in funding_kw) else 'news'
-                
-                news.append({
-                    'id': generate_id(link or title),
-                    'title': title,
-                    'summary': summary,
-                    'url': link,
-                    'source': source,
-                    'state': cfg['state'],
-                    'date': date_str,
-                    'category': category,
-                    'priority': get_priority(combined),
-                    'business_lines': get_business_lines(combined)
-                })
-                count += 1
-            print(f"    ✓ {count} items")
-        except Exception as e:
-            print(f"    ✗ {e}")
+                cache[source] = {
+                    'etag': response.headers.get('ETag'),
+                    'modified': response.headers.get('Last-Modified'),
+                    'items': items
+                }
+                news.extend(items)
+                log(f"    ✓ {len(items)} items")
+            except Exception as e:
+                log(f"    ✗ {e}")
     
-    news.sort(key=lambda x: x['date'], reverse=True)
+    save_feed_cache(cache)
+    news.sort(key=itemgetter('date'), reverse=True)
     return news
 
 
+def _fetch_rss_logged(today_str: Optional[str] = None) -> Tuple[List[Dict], List[str]]:
+    """fetch_rss_feeds() with its log lines held back for in-order output."""
+    with capture_log() as lines:
+        return fetch_rss_feeds(today_str), lines
+
+
 # =============================================================================
 # MARKET HEALTH & SUMMARY
 # =============================================================================
 
-def calculate_market_health(dot_lettings: List[Dict], news: List[Dict]) -> Dict:
-    total_value = sum(d.get('cost_low') or 0 for d in dot_lettings)
-    
-    if total_value >= 100000000:
-        dot_score, dot_trend, dot_action = 9.0, 'up', 'Expand highway capacity - strong pipeline'
-    elif total_value >= 50000000:
-        dot_score, dot_trend, dot_action = 8.2, 'up', 'Expand highway capacity'
-    elif total_value >= 20000000:
-        dot_score, dot_trend, dot_action = 7.0, 'stable', 'Maintain position'
-    elif total_value > 0:
-        dot_score, dot_trend, dot_action = 6.0, 'stable', 'Monitor opportunities'
-    else:
-        dot_score, dot_trend, dot_action = 8.2, 'up', 'Expand highway capacity'
+# Only the DOT pipeline score varies per run, so the weight sum and the
+# weighted contribution of the baseline metrics are fixed at import
+_TOTAL_WEIGHT = sum(MARKET_HEALTH_WEIGHTS.values())
+_BASELINE_WEIGHTED = sum(m['score'] * MARKET_HEALTH_WEIGHTS[k] for k, m in MARKET_HEALTH_BASELINE.items())
+
+# DOT pipeline (score, trend, action) by total cost_low, highest threshold
+# first; cost_low values are whole dollars, so '>= 1' means 'any pipeline'
+_DOT_THRESHOLDS = [
+    (100000000, (9.0, 'up', 'Expand highway capacity - strong pipeline')),
+    (50000000, (8.2, 'up', 'Expand highway capacity')),
+    (20000000, (7.0, 'stable', 'Maintain position')),
+    (1, (6.0, 'stable', 'Monitor opportunities')),
+]
+# A zero pipeline (no priced lettings) falls through to this
+_DEFAULT_DOT = (8.2, 'up', 'Expand highway capacity')
+
+
+def calculate_market_health(dot_lettings: List[Dict], news: List[Dict],
+                            total_value: Optional[int] = None) -> Dict:
+    if total_value is None:
+        total_value = sum(d.get('cost_low') or 0 for d in dot_lettings)
     
-    mh = {
-        'dot_pipeline': {'score': dot_score, 'trend': dot_trend, 'action': dot_action},
-        'housing_permits': {'score': 6.5, 'trend': 'stable', 'action': 'Monitor trends'},
-        'construction_spending': {'score': 6.1, 'trend': 'down', 'action': 'Selective investment'},
-        'migration': {'score': 7.3, 'trend': 'up', 'action': 'Geographic expansion'},
-        'input_cost_stability': {'score': 5.5, 'trend': 'down', 'action': 'Hedge 6 months'},
-        'infrastructure_funding': {'score': 7.8, 'trend': 'stable', 'action': 'Selective growth'}
-    }
+    dot_score, dot_trend, dot_action = next(
+        (v for threshold, v in _DOT_THRESHOLDS if total_value >= threshold), _DEFAULT_DOT)
     
-    weights = {'dot_pipeline': 0.15, 'housing_permits': 0.10, 'construction_spending': 0.10,
-               'migration': 0.10, 'input_cost_stability': 0.08, 'infrastructure_funding': 0.07}
+    mh = {'dot_pipeline': {'score': dot_score, 'trend': dot_trend, 'action': dot_action}}
+    mh.update((k, dict(m)) for k, m in MARKET_HEALTH_BASELINE.items())
     
-    total_w = sum(mh[k]['score'] * weights[k] for k in weights)
-    sum_w = sum(weights.values())
-    overall = round(total_w / sum_w, 1)
+    overall = round((dot_score * MARKET_HEALTH_WEIGHTS['dot_pipeline'] + _BASELINE_WEIGHTED) / _TOTAL_WEIGHT, 1)
     
     status = 'growth' if overall >= 7.5 else 'stable' if overall >= 6.0 else 'watchlist'
     mh['overall_score'] = overall
@@ -657,22 +1156,58 @@ def calculate_market_health(dot_lettings: List[Dict], news: List[Dict]) -> Dict:
     return mh
 
 
-def build_summary(dot_lettings: List[Dict], news: List[Dict]) -> Dict:
-    total_low = sum(d.get('cost_low') or 0 for d in dot_lettings)
-    total_high = sum(d.get('cost_high') or 0 for d in dot_lettings)
+def aggregate_dot(dot_lettings: List[Dict]) -> Dict:
+    """Every DOT total the run reports, from a single pass over the lettings."""
+    stats = {
+        'total_low': 0,
+        'total_high': 0,
+        'with_cost': 0,
+        'with_details': 0,
+        'count_by_state': dict.fromkeys(STATES, 0),
+        'value_by_state': dict.fromkeys(STATES, 0)
+    }
+    count_by_state = stats['count_by_state']
+    value_by_state = stats['value_by_state']
+    total_low = total_high = with_cost = with_details = 0
     
-    by_state = {s: 0 for s in STATES}
     for d in dot_lettings:
-        if d['state'] in by_state:
-            by_state[d['state']] += 1
+        cost = d.get('cost_low') or 0
+        total_low += cost
+        total_high += d.get('cost_high') or 0
+        if cost:
+            with_cost += 1
+        if d.get('project_type') or d.get('location'):
+            with_details += 1
+        if d['state'] in count_by_state:
+            count_by_state[d['state']] += 1
+            value_by_state[d['state']] += cost
+    
+    stats.update(total_low=total_low, total_high=total_high,
+                 with_cost=with_cost, with_details=with_details)
+    return stats
+
+
+def build_summary(dot_lettings: List[Dict], news: List[Dict],
+                  dot_stats: Optional[Dict] = None) -> Dict:
+    if dot_stats is None:
+        dot_stats = aggregate_dot(dot_lettings)
+    total_low = dot_stats['total_low']
+    total_high = dot_stats['total_high']
+    news_count = funding_count = 0
+    by_state = dict(dot_stats['count_by_state'])
+    
     for n in news:
         if n['state'] in by_state:
             by_state[n['state']] += 1
+        if n['category'] == 'news':
+            news_count += 1
+        elif n['category'] == 'funding':
+            funding_count += 1
     
     by_cat = {
         'dot_letting': len(dot_lettings),
-        'news': len([n for n in news if n['category'] == 'news']),
-        'funding': len([n for n in news if n['category'] == 'funding'])
+        'news': news_count,
+        'funding': funding_count
     }
     
     return {
@@ -689,37 +1224,49 @@ def build_summary(dot_lettings: List[Dict], news: List[Dict]) -> Dict:
 # =============================================================================
 
 def run_scraper() -> Dict:
+    # One clock reading for the whole run: header, undated news, 'generated'
+    run_now = datetime.now(timezone.utc)
+    run_local = run_now.astimezone()
+    
     print("=" * 60)
     print("NECMIS SCRAPER - PHASE 2.2 (MA + ME Parsers)")
     print("=" * 60)
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Time: {run_local.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Pandas available: {PANDAS_AVAILABLE}")
     print()
     
-    print("[1/3] DOT Bid Schedules...")
-    dot_lettings = fetch_dot_lettings()
-    with_cost = len([d for d in dot_lettings if d.get('cost_low')])
-    with_details = len([d for d in dot_lettings if d.get('project_type') or d.get('location')])
-    total_val = sum(d.get('cost_low') or 0 for d in dot_lettings)
-    print(f"  Total: {len(dot_lettings)} ({with_cost} with $, {with_details} with details)")
-    print(f"  Pipeline: {format_currency(total_val)}")
-    print()
-    
-    print("[2/3] RSS Feeds...")
-    news = fetch_rss_feeds()
+    # RSS feeds don't depend on the DOT portals, so they download in the
+    # background while the DOT section runs and print once it is done
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        rss_job = ex.submit(_fetch_rss_logged, run_local.strftime('%Y-%m-%d'))
+        
+        print("[1/3] DOT Bid Schedules...")
+        dot_lettings = fetch_dot_lettings()
+        dot_stats = aggregate_dot(dot_lettings)
+        with_cost = dot_stats['with_cost']
+        with_details = dot_stats['with_details']
+        total_val = dot_stats['total_low']
+        print(f"  Total: {len(dot_lettings)} ({with_cost} with $, {with_details} with details)")
+        print(f"  Pipeline: {format_currency(total_val)}")
+        print()
+        
+        print("[2/3] RSS Feeds...")
+        news, rss_lines = rss_job.result()
+    for line in rss_lines:
+        print(line)
     print(f"  Total: {len(news)} items")
     print()
     
     print("[3/3] Market Health...")
-    mh = calculate_market_health(dot_lettings, news)
+    mh = calculate_market_health(dot_lettings, news, total_val)
     print(f"  Score: {mh['overall_score']}/10 ({mh['overall_status'].upper()})")
     print(f"  DOT Pipeline: {mh['dot_pipeline']['score']}/10")
     print()
     
-    summary = build_summary(dot_lettings, news)
+    summary = build_summary(dot_lettings, news, dot_stats)
     
     data = {
-        'generated': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        'generated': run_now.isoformat().replace('+00:00', 'Z'),
         'summary': summary,
         'dot_lettings': dot_lettings,
         'news': news,
@@ -737,8 +1284,8 @@ def run_scraper() -> Dict:
     print()
     print("By State:")
     for state in ['MA', 'ME', 'VT', 'NH']:
-        count = len([d for d in dot_lettings if d['state'] == state])
-        val = sum(d.get('cost_low') or 0 for d in dot_lettings if d['state'] == state)
+        count = dot_stats['count_by_state'][state]
+        val = dot_stats['value_by_state'][state]
         print(f"  {state}: {count} projects, {format_currency(val)}")
     print("=" * 60)
     
@@ -746,8 +1293,12 @@ def run_scraper() -> Dict:
 
 
 if __name__ == '__main__':
+    logging.basicConfig(format='    %(message)s', level=logging.INFO)
+    # Only our own diagnostics: urllib3/requests-cache debug lines would print
+    # straight from worker threads, outside the per-stage log buffers
+    if os.environ.get('NECMIS_VERBOSE'):
+        logger.setLevel(logging.DEBUG)
     data = run_scraper()
     os.makedirs('data', exist_ok=True)
-    with open('data/necmis_data.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json('data/necmis_data.json', data)
     print("✓ Saved to data/necmis_data.json")
@@ -0,0 +1,319 @@
+"""Regression tests for the scraper's parsing helpers (no network access)."""
+
+from pathlib import Path
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+import scraper
+
+TODAY = '2026-03-15'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def rss(items: str) -> bytes:
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>Feed</title>{items}</channel></rss>').encode()
+
+
+@pytest.fixture(params=[True, False], ids=['lxml', 'feedparser'])
+def feed_path(request, monkeypatch):
+    """Run each feed test through the lxml fast path and through feedparser."""
+    monkeypatch.setattr(scraper, 'LXML_AVAILABLE', request.param)
+    return request.param
+
+
+def parse(content: bytes):
+    return scraper._parse_feed_items('Test', {'state': 'VT'}, content, TODAY)
+
+
+# =============================================================================
+# RSS SUMMARIES
+# =============================================================================
+
+def test_clean_summary_drops_script_and_style_contents():
+    summary = ('<style>.wp-block-image{margin:0 auto}</style><p>Town approves road paving</p>'
+               '<script>var x=1;</script>')
+    assert scraper._clean_summary(summary) == 'Town approves road paving'
+
+
+def test_feed_summary_drops_embedded_style_block(feed_path):
+    items = parse(rss(
+        '<item><title>Road work</title><link>https://example.com/1</link>'
+        '<description><![CDATA[<style>.wp-block-image{margin:0 auto}</style>'
+        '<p>Town approves road paving</p><script>var x=1;</script>]]></description>'
+        '<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate></item>'))
+    assert [i['summary'] for i in items] == ['Town approves road paving']
+
+
+def test_feed_title_tags_separate_words(feed_path):
+    items = parse(rss(
+        '<item><title><![CDATA[<b>Road</b><br>work  <style>b{}</style>approved]]></title>'
+        '<link>https://example.com/1</link><description>Town approves road paving</description>'
+        '<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate></item>'))
+    assert [i['title'] for i in items] == ['Road work approved']
+
+
+# =============================================================================
+# RSS DATES
+# =============================================================================
+
+@pytest.mark.parametrize('pub_date, expected', [
+    ('Mon, 02 Mar 2026 10:00:00 GMT', '2026-03-02'),
+    ('Mon, 02 Mar 2026 23:30:00 EST', '2026-03-03'),
+    # No zone: feedparser gives no published_parsed, so the run date is used
+    ('Mon, 02 Mar 2026 10:00:00', TODAY),
+    ('Mon, 02 Mar 2026 23:30:00 -0000', '2026-03-02'),
+])
+def test_feed_pubdate_matches_feedparser(feed_path, pub_date, expected):
+    items = parse(rss(
+        '<item><title>Road work</title><link>https://example.com/1</link>'
+        f'<pubDate>{pub_date}</pubDate></item>'))
+    assert [i['date'] for i in items] == [expected]
+
+
+def test_fast_path_leaves_zoneless_pubdate_to_feedparser():
+    content = rss('<item><title>Road work</title><link>https://example.com/1</link>'
+                  '<pubDate>Mon, 02 Mar 2026 10:00:00</pubDate></item>')
+    assert scraper._parse_rss_fast(content) is None
+
+
+# =============================================================================
+# FEED CACHE
+# =============================================================================
+
+class FeedResponse:
+    def __init__(self, status_code: int, content: bytes = b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Server Error')
+
+
+class FeedSession:
+    """Answers successive GETs from `responses` and records the headers sent."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_validators_only_sent_with_cached_items(monkeypatch):
+    session = FeedSession([FeedResponse(200), FeedResponse(200)])
+    monkeypatch.setattr(scraper, 'get_session', lambda: session)
+    validators = {'etag': '"v1"', 'modified': 'Mon, 02 Mar 2026 10:00:00 GMT'}
+    scraper._fetch_feed({'url': 'https://example.com/feed'}, validators)
+    scraper._fetch_feed({'url': 'https://example.com/feed'}, dict(validators, items=[]))
+    assert session.sent == [{}, {'If-None-Match': '"v1"',
+                                 'If-Modified-Since': 'Mon, 02 Mar 2026 10:00:00 GMT'}]
+
+
+def test_feed_cache_reuses_items_on_304_and_keeps_them_on_error(monkeypatch, tmp_path):
+    cache_path = tmp_path / 'feed_cache.json'
+    monkeypatch.setattr(scraper, 'FEED_CACHE_PATH', str(cache_path))
+    monkeypatch.setattr(scraper, 'RSS_FEEDS', {'Test': {'url': 'https://example.com/feed', 'state': 'VT'}})
+    modified = 'Mon, 02 Mar 2026 10:00:00 GMT'
+    session = FeedSession([
+        FeedResponse(200, rss('<item><title>Road work</title><link>https://example.com/1</link>'
+                              '<description>Town approves road paving</description>'
+                              '<pubDate>Mon, 02 Mar 2026 10:00:00 GMT</pubDate></item>'),
+                     {'ETag': '"v1"', 'Last-Modified': modified}),
+        FeedResponse(304),
+        FeedResponse(500),
+    ])
+    monkeypatch.setattr(scraper, 'get_session', lambda: session)
+
+    fresh = scraper.fetch_rss_feeds(TODAY)
+    assert [i['title'] for i in fresh] == ['Road work']
+    saved = json.loads(cache_path.read_text())
+    assert saved == {'Test': {'etag': '"v1"', 'modified': modified, 'items': fresh}}
+
+    assert scraper.fetch_rss_feeds(TODAY) == fresh
+    assert json.loads(cache_path.read_text()) == saved
+
+    assert scraper.fetch_rss_feeds(TODAY) == []
+    assert json.loads(cache_path.read_text()) == saved
+
+    assert session.sent == [{}] + [{'If-None-Match': '"v1"', 'If-Modified-Since': modified}] * 2
+
+
+# =============================================================================
+# MASSDOT
+# =============================================================================
+
+class FakeResponse:
+    encoding = 'utf-8'
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        # Small chunks so tags and strings straddle chunk boundaries
+        for i in range(0, len(self.content), 100):
+            yield self.content[i:i + 100]
+
+
+class FakeSession:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.content)
+
+
+@pytest.fixture(params=[True, False], ids=['lxml', 'bs4'])
+def massdot_path(request, monkeypatch):
+    """
+    Run each MassDOT test through the lxml stream and the BS4 fallback.
+    Returns the parsers handed to BeautifulSoup, so tests can check the
+    fallback runs exactly as it does without lxml installed.
+    """
+    monkeypatch.setattr(scraper, 'LXML_AVAILABLE', request.param)
+    parsers = []
+
+    def spy(markup, features=None, **kwargs):
+        parsers.append(features)
+        return BeautifulSoup(markup, features, **kwargs)
+
+    monkeypatch.setattr(scraper, 'BeautifulSoup', spy)
+    return parsers
+
+
+def baseline_text(html: bytes) -> str:
+    """The original extraction: whole page, scripts and styles decomposed."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return scraper._BLANK_LINES_RE.sub('\n', soup.get_text(separator='\n'))
+
+
+def test_massdot_text_matches_baseline_get_text():
+    html = (FIXTURES / 'massdot_status.html').read_bytes()
+    text, size = scraper._massdot_text_lxml(FakeResponse(html))
+    assert size == len(html)
+    assert scraper._BLANK_LINES_RE.sub('\n', text).split() == baseline_text(html).split()
+    assert '999,999,999' not in text and 'NOT A PROJECT' not in text
+
+
+def test_massdot_fixture_projects_match_baseline(massdot_path, monkeypatch):
+    html = (FIXTURES / 'massdot_status.html').read_bytes()
+    monkeypatch.setattr(scraper, 'get_session', lambda: FakeSession(html))
+    lettings = scraper.parse_massdot()
+    assert massdot_path == ([] if scraper.LXML_AVAILABLE else ['html.parser'])
+    fields = ('project_id', 'location', 'cost_low', 'ad_date', 'district', 'project_type', 'description')
+    assert [tuple(l[f] for f in fields) for l in lettings] == [
+        ('612345', 'Worcester', 4512300, '2026-02-14', 3, 'Resurfacing',
+         'Resurfacing and related work on Route 9'),
+        ('609876', 'Springfield', 18250000, '2026-03-07', 2, 'Bridge Replacement',
+         'Bridge replacement, S-24-012, Main Street over Mill River'),
+        # Values here are <p> text beside the <b> labels, outside any table
+        ('613002', 'Boston', 2140000, '2026-04-18', 6, 'Traffic Signals',
+         'Traffic signal upgrades at 12 locations'),
+    ]
+
+
+# =============================================================================
+# MAINEDOT
+# =============================================================================
+
+def mainedot_lettings(monkeypatch, df):
+    monkeypatch.setattr(scraper.pd, 'read_excel', lambda *args, **kwargs: df.copy())
+    monkeypatch.setattr(scraper, 'get_session', lambda: FakeSession(b'xls'))
+    lettings = scraper.parse_mainedot()
+    for l in lettings:
+        l['business_lines'] = sorted(l['business_lines'])
+    return lettings
+
+
+def me_letting(key, **fields):
+    letting = {
+        'id': scraper.generate_id(key), 'state': 'ME', 'project_id': None,
+        'cost_low': None, 'cost_high': None, 'cost_display': 'See Portal',
+        'ad_date': None, 'let_date': None, 'district': None,
+        'url': scraper.DOT_SOURCES['ME']['portal_url'], 'source': 'MaineDOT',
+    }
+    letting.update(fields)
+    return letting
+
+
+def test_mainedot_rows_match_baseline(monkeypatch):
+    df = pd.DataFrame({
+        'Work Type': ['Bridge Construction', 'Highway Preservation Paving', np.nan, 'Multimodal',
+                      'Unlisted Work', np.nan],
+        'Advertise Date': ['01/15/2026', '2026-02-03', np.nan, 'soon', '03/04/2026',
+                           pd.Timestamp('2026-05-06')],
+        'Scope': ['Bridge Replacement', np.nan, np.nan, '', 'Drainage', np.nan],
+        'Location/Title': ['Augusta', ' Bangor ', np.nan, 'Portland', 'Rural Road', ''],
+        'Details': ['Over Kennebec River', np.nan, np.nan, 'Station work', np.nan, np.nan],
+        'Project Identification No.': ['024567.00', 25001, np.nan, np.nan, '026001.00', '1'],
+        'Administered By': ['State', 'State', np.nan, 'Municipal', 'State', 'State'],
+        'Total Project Estimate': ['$1,250,000', 3400000.0, np.nan, float('inf'), 'nan', 5.0],
+    })
+    assert mainedot_lettings(monkeypatch, df) == [
+        me_letting('ME-024567.00-Augusta', project_id='024567.00',
+                   description='Bridge Replacement: Augusta - Over Kennebec River',
+                   cost_low=1250000, cost_high=1250000, cost_display='$1.2M', ad_date='2026-01-15',
+                   project_type='Bridge Construction', location='Augusta',
+                   business_lines=['aggregates', 'highway', 'ready_mix']),
+        me_letting('ME-25001-Bangor', project_id='25001', description='Bangor',
+                   cost_low=3400000, cost_high=3400000, cost_display='$3.4M', ad_date='2026-02-03',
+                   project_type='Highway Preservation Paving', location='Bangor',
+                   business_lines=['highway', 'hma']),
+        # Rows 2 and 5 have no location and are skipped. The baseline skipped
+        # rows 3 and 4 too: a non-finite or 'nan' cost now keeps the row
+        # with 'See Portal', keyed by row number when there is no project id
+        me_letting('ME-3-Portland', description='Portland - Station work',
+                   project_type='Multimodal', location='Portland', business_lines=['highway']),
+        me_letting('ME-026001.00-Rural Road', project_id='026001.00',
+                   description='Drainage: Rural Road', ad_date='2026-03-04',
+                   project_type='Unlisted Work', location='Rural Road', business_lines=['highway']),
+    ]
+
+
+def test_mainedot_skips_nat_only_rows(monkeypatch):
+    # Datetime column, no cost/scope/details/id columns. iterrows upcast the
+    # NaT-only middle row to datetime and emitted a 'NaT' letting for it
+    df = pd.DataFrame({
+        ' Advertise Date ': pd.to_datetime(['2026-04-01', None, '2026-04-22']),
+        'Location/Title': ['Lewiston', np.nan, 'Bath'],
+        'Work Type': ['Highway Safety and Spot Improvements', np.nan, 'Bridge Other'],
+    })
+    assert mainedot_lettings(monkeypatch, df) == [
+        me_letting('ME-0-Lewiston', project_id='', description='Lewiston', ad_date='2026-04-01',
+                   project_type='Highway Safety and Spot Improvements', location='Lewiston',
+                   business_lines=['highway']),
+        me_letting('ME-2-Bath', project_id='', description='Bath', ad_date='2026-04-22',
+                   project_type='Bridge Other', location='Bath', business_lines=['highway']),
+    ]
+
+
+# =============================================================================
+# FORMATTING
+# =============================================================================
+
+@pytest.mark.parametrize('amount, expected', [
+    (None, None),
+    (999.5, '$1,000'),
+    (2500, '$2K'),
+    (1150000, '$1.1M'),
+    (1250000, '$1.2M'),
+    (164600000.0, '$164.6M'),
+    (1250000000, '$1.2B'),
+])
+def test_format_currency_keeps_float_rounding(amount, expected):
+    assert scraper.format_currency(amount) == expected